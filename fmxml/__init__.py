@@ -11,6 +11,9 @@ except:
     __version__ = 'unknown'
 
 from .fms import FileMakerServer
+from .async_fms import AsyncFileMakerServer
+from .cache import LayoutCache
+from . import cache
 from . import commands
 from . import parsers
 from . import structure
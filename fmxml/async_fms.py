@@ -0,0 +1,224 @@
+#
+# coding: utf-8
+#
+# fmxml.async_fms
+#
+from base64 import b64encode
+
+from .fms import FileMakerServer
+
+try:
+    import aiohttp
+except ImportError:  # pragma: no cover
+    aiohttp = None
+
+
+class AsyncFileMakerServer(FileMakerServer):
+    """
+    :py:class:`.FileMakerServer` for use with :py:mod:`asyncio`. Requires
+    *aiohttp*.
+
+    The command factories are those of :py:class:`.FileMakerServer`. The
+    commands are executed with ``await command.execute_async()``. The
+    query strings and the parsers are exactly the same as those used by
+    the blocking methods::
+
+        async with AsyncFileMakerServer(**params) as fms:
+            find_command = fms.create_find_records_command('Invoices')
+            find_command_result = await find_command.execute_async()
+
+    The value lists of a :py:class:`.Layout` (FMPXMLLAYOUT grammar) are
+    loaded on demand. Use :py:meth:`load_valuelists_async` before
+    :py:meth:`.Layout.get_valuelist` so as not to block the event loop.
+    """
+    __slots__ = ('_connection_limit', '_aiohttp_session', '_prefetched',)
+
+    def __init__(self,
+                 hostspec,  # e.g. http://localhost
+                 username,
+                 password,
+                 db=None,
+                 layout_cache=None,
+                 connection_limit=100):
+        """
+        Args:
+            connection_limit (int): Maximum number of simultaneous
+              connections to the server.
+        """
+        if aiohttp is None:
+            raise ImportError('aiohttp is required for AsyncFileMakerServer')
+        assert isinstance(connection_limit, int) and connection_limit > 0
+
+        super().__init__(hostspec, username, password, db, layout_cache)
+        self._connection_limit = connection_limit
+        self._aiohttp_session = None
+        # {(xml_grammar, query): xml_bytes}
+        self._prefetched = {}
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.aclose()
+
+    async def aclose(self):
+        if self._aiohttp_session is not None:
+            await self._aiohttp_session.close()
+            self._aiohttp_session = None
+        self.close()
+
+    @property
+    def connection_limit(self):
+        return self._connection_limit
+
+    @property
+    def aiohttp_session(self):
+        """
+        Returns:
+          aiohttp.ClientSession: Session object. Must be used from within
+            a running event loop.
+        """
+        if self._aiohttp_session is None:
+            connector = aiohttp.TCPConnector(limit=self._connection_limit)
+            headers = {}
+            # The username/password relates to this instance.
+            if self.username:
+                credentials = f'{self.username}:{self.password}'.encode('utf-8')
+                headers['Authorization'] = f'Basic {b64encode(credentials).decode("ascii")}'
+            self._aiohttp_session = aiohttp.ClientSession(connector=connector, headers=headers)
+
+        return self._aiohttp_session
+
+    async def execute_query_async(self, query, xml_grammar='fmresultset'):
+        """
+        Asynchronous variant of :py:meth:`.FileMakerServer.execute_query`.
+        """
+        xml_url = self._get_xml_url(query, xml_grammar)
+        return await self._get_async(xml_url)
+
+    def execute_query(self, query, xml_grammar='fmresultset'):
+        key = (xml_grammar, query)
+        if key in self._prefetched:
+            return self._prefetched[key]
+
+        self._log.warning(f'Blocking request for {xml_grammar} from AsyncFileMakerServer.')
+        return super().execute_query(query, xml_grammar)
+
+    async def prefetch_fmpxmllayout_(self, layout_name):
+        """
+        Request the FMPXMLLAYOUT grammar of the layout, which is required
+        to construct a :py:class:`.Layout`, unless it has already been
+        requested.
+        """
+        from .structure import Layout
+
+        query = Layout.get_fmpxmllayout_query_(self.db_name, layout_name)
+        key = ('FMPXMLLAYOUT', query)
+        if key not in self._prefetched:
+            self._prefetched[key] = await self.execute_query_async(query, 'FMPXMLLAYOUT')
+
+    async def load_valuelists_async(self, layout):
+        """
+        Load the value lists of the layout without blocking the event loop.
+        """
+        await self.prefetch_fmpxmllayout_(layout.name)
+        layout.load_valuelists_()
+
+    async def find_record_by_id_async(self, layout_name, record_id):
+        """
+        Asynchronous variant of :py:meth:`.FileMakerServer.find_record_by_id`.
+        """
+        assert isinstance(layout_name, str)
+        assert isinstance(record_id, int)
+        assert record_id > 0
+
+        command_object = self.create_find_records_command(layout_name)
+        command_object.record_id = record_id
+        command_result = await command_object.execute_async()
+
+        record_list = command_result.records
+        if record_list:
+            return record_list[0]
+        else:
+            self._log.info(f'Record "{record_id}" not found in layout "{layout_name}".')
+            return None
+
+    async def get_layout_async(self, layout_name):
+        """
+        Asynchronous variant of :py:meth:`.FileMakerServer.get_layout`.
+        """
+        from .structure import Layout
+        from .commands import CommandContainer, Command
+        from .parsers import DataGrammarParser
+
+        if layout_name in self._layout_lookup:
+            return self._layout_lookup[layout_name]
+
+        layout = self.get_cached_layout_(layout_name)
+        if layout is not None:
+            self._layout_lookup[layout_name] = layout
+            return layout
+
+        command_params = [
+            Command('-db', self.db_name),
+            Command('-lay', layout_name),
+            Command('-view'),
+        ]
+        query = CommandContainer(*command_params).as_query()
+
+        xml_bytes = await self.execute_query_async(query)
+        assert xml_bytes
+
+        parser = DataGrammarParser()
+        parsed_data = parser.parse(xml_bytes)
+        layout = Layout(self, parsed_data)
+        self.put_cached_layout_(parsed_data, layout)
+
+        self._layout_lookup[layout_name] = layout
+        return layout
+
+    async def get_db_names_async(self):
+        from .commands import Command
+        commands = [
+            Command('-dbnames'),
+        ]
+        return await self._get_names_async(commands)
+
+    async def get_layout_names_async(self):
+        from .commands import Command
+        commands = [
+            Command('-db', self.db_name),
+            Command('-layoutnames'),
+        ]
+        return await self._get_names_async(commands)
+
+    async def get_script_names_async(self):
+        from .commands import Command
+        commands = [
+            Command('-db', self.db_name),
+            Command('-scriptnames'),
+        ]
+        return await self._get_names_async(commands)
+
+    async def _get_names_async(self, commands):
+        from .commands import CommandContainer
+
+        query = CommandContainer(*commands).as_query()
+
+        xml_bytes = await self.execute_query_async(query)
+        return self._parse_names(xml_bytes)
+
+    async def get_container_data_async(self, url):
+        """
+        Asynchronous variant of :py:meth:`.FileMakerServer.get_container_data`.
+        """
+        assert isinstance(url, str)
+        assert url.lower().startswith('/fmi/xml/cnt')
+
+        container_url = self.get_container_data_url(url)
+        return await self._get_async(container_url)
+
+    async def _get_async(self, url):
+        async with self.aiohttp_session.get(url) as resp:
+            resp.raise_for_status()  # promulgate errors from the bowels of aiohttp
+            return await resp.read()
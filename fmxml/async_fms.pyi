@@ -0,0 +1,67 @@
+#
+# coding: utf-8
+#
+# Stubs for fmxml.async_fms
+#
+from typing import List, Optional, Dict, Tuple, Any
+
+from .cache import layout_cache as layout_cache_module
+from .commands import command_container as command_container_module
+from .fms import FileMakerServer
+from .structure import layout as layout_module
+from .structure import record as record_module
+
+
+class AsyncFileMakerServer(FileMakerServer):
+    _connection_limit: int
+    _aiohttp_session: Any  # aiohttp.ClientSession
+    _prefetched: Dict[Tuple[str, str], bytes]
+
+    def __init__(self,
+                 hostspec: str,
+                 username: str,
+                 password: str,
+                 db: Optional[str] = None,
+                 layout_cache: Optional[layout_cache_module.LayoutCache] = None,
+                 connection_limit: int = ...) \
+            -> None:
+        ...
+
+    async def __aenter__(self) -> 'AsyncFileMakerServer': ...
+
+    async def __aexit__(self, exc_type: Any, exc_val: Any, exc_tb: Any) -> None: ...
+
+    async def aclose(self) -> None: ...
+
+    @property
+    def connection_limit(self) -> int: ...
+
+    @property
+    def aiohttp_session(self) -> Any: ...
+
+    async def execute_query_async(self, query: str, xml_grammar: str = ...) -> bytes: ...
+
+    def execute_query(self, query: str, xml_grammar: str = ...) -> bytes: ...
+
+    async def prefetch_fmpxmllayout_(self, layout_name: str) -> None: ...
+
+    async def load_valuelists_async(self, layout: layout_module.Layout) -> None: ...
+
+    async def find_record_by_id_async(self,
+                                      layout_name: str,
+                                      record_id: int) \
+            -> Optional[record_module.Record]: ...
+
+    async def get_layout_async(self, layout_name: str) -> layout_module.Layout: ...
+
+    async def get_db_names_async(self) -> List[str]: ...
+
+    async def get_layout_names_async(self) -> List[str]: ...
+
+    async def get_script_names_async(self) -> List[str]: ...
+
+    async def _get_names_async(self, commands: List[command_container_module.Command]) -> List[str]: ...
+
+    async def get_container_data_async(self, url: str) -> bytes: ...
+
+    async def _get_async(self, url: str) -> bytes: ...
@@ -0,0 +1,6 @@
+#
+# coding: utf-8
+#
+# fmxml.cache.__init__
+#
+from .layout_cache import LayoutCache
@@ -0,0 +1,186 @@
+#
+# coding: utf-8
+#
+# fmxml.cache.layout_cache
+#
+import hashlib
+import logging
+import os
+import pickle
+import tempfile
+import time
+from collections import namedtuple
+from pathlib import Path
+
+# Bump whenever the pickled structure changes, older entries are ignored.
+CACHE_FORMAT_VERSION = 1
+
+# The parts of the parsed fmresultset needed to construct a Layout.
+LayoutMetadata = namedtuple('LayoutMetadata', 'datasource field_definitions relatedset_definitions')
+
+CachedLayout = namedtuple('CachedLayout', 'metadata fmpxmllayout')
+
+_CacheEntry = namedtuple('_CacheEntry', 'version key created metadata fmpxmllayout')
+
+
+class LayoutCache:
+    """
+    On-disk cache of the layout information required to construct a
+    :py:class:`.Layout` - the field definitions, the portal (related set)
+    definitions and the value lists. Can be shared between processes, for
+    example by a pool of workers, so that only the first of them has to
+    request the layout information from the server::
+
+        layout_cache = LayoutCache('/var/cache/fmxml', ttl=3600)
+        fms = FileMakerServer(**params, layout_cache=layout_cache)
+
+    There is one file per layout keyed by hostspec, database and layout
+    name. Entries older than *ttl* seconds are ignored.
+
+    .. warning::
+
+        The entries are pickled. Only use a directory that is not writable
+        by untrusted users.
+    """
+    __slots__ = ('_log', '_directory', '_ttl',)
+
+    def __init__(self, directory, ttl=3600):
+        """
+        Args:
+            directory: Directory for the cache files. Created if it does
+              not exist.
+            ttl: Time to live of an entry in seconds. ``None`` for entries
+              that never expire.
+        """
+        assert ttl is None or ttl > 0
+
+        self._log = logging.getLogger(__name__)
+        self._directory = Path(directory)
+        self._directory.mkdir(parents=True, exist_ok=True)
+        self._ttl = ttl
+
+    @property
+    def directory(self):
+        return self._directory
+
+    @property
+    def ttl(self):
+        return self._ttl
+
+    def get(self, hostspec, db_name, layout_name):
+        """
+        Returns:
+            CachedLayout: The cached metadata (a
+              :py:data:`LayoutMetadata`) and the parsed FMPXMLLAYOUT
+              grammar, or None if there is no valid entry.
+        """
+        entry = self._get_entry(self._get_key(hostspec, db_name, layout_name))
+        if entry is None:
+            return None
+
+        return CachedLayout(entry.metadata, entry.fmpxmllayout)
+
+    def put(self, hostspec, db_name, layout_name, parsed_data, fmpxmllayout):
+        """
+        Store the layout information.
+
+        Args:
+            parsed_data: The parsed fmresultset from
+              :py:class:`.DataGrammarParser` that the layout was created from.
+              Only the datasource and definitions are stored.
+            fmpxmllayout: The parsed FMPXMLLAYOUT grammar from
+              :py:class:`.InfoGrammarParser`, or None if the value lists
+              have not been loaded (yet).
+        """
+        key = self._get_key(hostspec, db_name, layout_name)
+        metadata = LayoutMetadata(parsed_data.datasource,
+                                  list(parsed_data.field_definitions),
+                                  dict(parsed_data.relatedset_definitions))
+        self._write(_CacheEntry(CACHE_FORMAT_VERSION, key, time.time(), metadata, fmpxmllayout))
+
+    def put_fmpxmllayout(self, hostspec, db_name, layout_name, fmpxmllayout):
+        """
+        Add the parsed FMPXMLLAYOUT grammar (the value lists) to an existing
+        entry. The age of the entry is unchanged. Does nothing if there is no
+        valid entry for the layout.
+        """
+        entry = self._get_entry(self._get_key(hostspec, db_name, layout_name))
+        if entry is not None:
+            self._write(entry._replace(fmpxmllayout=fmpxmllayout))
+
+    def _get_entry(self, key):
+        """
+        Returns:
+            The entry for the key if it is valid and has not expired.
+        """
+        path = self._get_path(key)
+
+        entry = self._read(path)
+        if entry is None:
+            return None
+
+        if (not isinstance(entry, _CacheEntry)
+                or entry.version != CACHE_FORMAT_VERSION
+                or entry.key != key):
+            self._log.info(f'Discarding invalid layout cache entry {path}')
+            self._unlink(path)
+            return None
+
+        if self._ttl is not None and time.time() - entry.created > self._ttl:
+            self._log.info(f'Layout cache entry for "{key[2]}" has expired.')
+            return None
+
+        return entry
+
+    def _write(self, entry):
+        # Write to a temporary file then rename so that another process
+        # never reads a partially written entry.
+        fd, temp_name = tempfile.mkstemp(dir=self._directory, suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'wb') as fp:
+                pickle.dump(entry, fp, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(temp_name, self._get_path(entry.key))
+        except BaseException:
+            self._unlink(Path(temp_name))
+            raise
+
+    def _read(self, path):
+        try:
+            with path.open('rb') as fp:
+                return pickle.load(fp)
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            self._log.warning(f'Discarding unreadable layout cache entry {path}: {e!r}')
+            self._unlink(path)
+            return None
+
+    def invalidate(self, hostspec, db_name, layout_name):
+        """
+        Remove the entry for the layout, for example after the layout has
+        been changed in FileMaker.
+        """
+        key = self._get_key(hostspec, db_name, layout_name)
+        self._unlink(self._get_path(key))
+
+    def clear(self):
+        """
+        Remove all the entries.
+        """
+        for path in self._directory.glob('*.layout'):
+            self._unlink(path)
+
+    @staticmethod
+    def _get_key(hostspec, db_name, layout_name):
+        return hostspec, db_name, layout_name
+
+    def _get_path(self, key):
+        digest = hashlib.sha256('\0'.join(key).encode('utf-8')).hexdigest()
+        return self._directory / f'{digest}.layout'
+
+    @staticmethod
+    def _unlink(path):
+        try:
+            path.unlink()
+        except FileNotFoundError:
+            pass
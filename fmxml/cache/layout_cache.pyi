@@ -0,0 +1,81 @@
+#
+# coding: utf-8
+#
+# Stubs for fmxml.cache.layout_cache
+#
+from logging import Logger
+from pathlib import Path
+from typing import Any, Dict, List, NamedTuple, Optional, Tuple, Union
+
+from ..parsers import data_grammar as data_grammar_module
+from ..parsers import info_grammar as info_grammar_module
+
+CACHE_FORMAT_VERSION: int = ...
+
+
+class LayoutMetadata(NamedTuple):
+    datasource: data_grammar_module.RawDataSource
+    field_definitions: List[data_grammar_module.RawFieldDefinition]
+    relatedset_definitions: Dict[str, List[data_grammar_module.RawFieldDefinition]]
+
+
+class CachedLayout(NamedTuple):
+    metadata: LayoutMetadata
+    fmpxmllayout: Optional[info_grammar_module.RawFMPXMLLayout]
+
+
+class _CacheEntry(NamedTuple):
+    version: int
+    key: Tuple[str, str, str]
+    created: float
+    metadata: LayoutMetadata
+    fmpxmllayout: Optional[info_grammar_module.RawFMPXMLLayout]
+
+
+class LayoutCache:
+    _log: Logger
+    _directory: Path
+    _ttl: Optional[float]
+
+    def __init__(self, directory: Union[str, Path], ttl: Optional[float] = ...) -> None: ...
+
+    @property
+    def directory(self) -> Path: ...
+
+    @property
+    def ttl(self) -> Optional[float]: ...
+
+    def get(self, hostspec: str, db_name: str, layout_name: str) -> Optional[CachedLayout]: ...
+
+    def put(self,
+            hostspec: str,
+            db_name: str,
+            layout_name: str,
+            parsed_data: Any,
+            fmpxmllayout: Optional[info_grammar_module.RawFMPXMLLayout]) \
+            -> None: ...
+
+    def put_fmpxmllayout(self,
+                         hostspec: str,
+                         db_name: str,
+                         layout_name: str,
+                         fmpxmllayout: info_grammar_module.RawFMPXMLLayout) \
+            -> None: ...
+
+    def _get_entry(self, key: Tuple[str, str, str]) -> Optional[_CacheEntry]: ...
+
+    def _write(self, entry: _CacheEntry) -> None: ...
+
+    def _read(self, path: Path) -> Any: ...
+
+    def invalidate(self, hostspec: str, db_name: str, layout_name: str) -> None: ...
+
+    def clear(self) -> None: ...
+
+    @staticmethod
+    def _get_key(hostspec: str, db_name: str, layout_name: str) -> Tuple[str, str, str]: ...
+
+    def _get_path(self, key: Tuple[str, str, str]) -> Path: ...
+
+    @staticmethod
+    def _unlink(path: Path) -> None: ...
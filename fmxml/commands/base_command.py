@@ -7,7 +7,7 @@ import abc
 
 from .command_container import CommandContainer, Command
 from ..parsers import DataGrammarParser
-from ..structure import CommandResult
+from ..structure import CommandResult, LazyCommandResult, ColumnarResult
 
 
 class BaseCommand0(abc.ABC):
@@ -54,11 +54,77 @@ class BaseCommand(BaseCommand1, BaseCommand0):
         )
         return command_params
 
-    def execute(self):
-        query = self.get_query()
+    def execute(self, lazy=False, portals=True, columnar=False):
+        """
+        Args:
+            lazy (bool): If true return a :py:class:`.LazyCommandResult`
+              which only creates each :py:class:`.Record` when it is
+              accessed.
+            portals (bool): If false the portal records are not created.
+            columnar (bool): If true return a :py:class:`.ColumnarResult`
+              with a column of values per field rather than records.
+
+        Returns:
+            :py:class:`.CommandResult`: Result of executing the command.
+        """
+        return self._execute_query(self.get_query(), lazy, portals, columnar)
+
+    def _execute_query(self, query, lazy=False, portals=True, columnar=False):
+        """
+        Execute *query*, which need not be the result of :py:meth:`get_query`.
+        See :py:meth:`execute` for the arguments.
+        """
         xml_bytes = self._fms.execute_query(query)
+        return self._create_result(xml_bytes, lazy, portals, columnar)
+
+    async def execute_async(self, lazy=False, portals=True, columnar=False):
+        """
+        Asynchronous variant of :py:meth:`execute` for use with
+        :py:class:`.AsyncFileMakerServer`. See :py:meth:`execute` for the
+        arguments.
+        """
+        xml_bytes = await self._fms.execute_query_async(self.get_query())
+        return self._create_result(xml_bytes, lazy, portals, columnar)
+
+    def _create_result(self, xml_bytes, lazy=False, portals=True, columnar=False):
         assert xml_bytes
 
+        if columnar:
+            # The raw records are consumed as they are parsed.
+            raw_items = DataGrammarParser().iterparse([xml_bytes])
+            parsed_data = next(raw_items)
+            return ColumnarResult(self._fms, parsed_data, raw_items)
+
         parsed_data = DataGrammarParser().parse(xml_bytes)
         # populate result
-        return CommandResult(self._fms, parsed_data)
+        if lazy:
+            return LazyCommandResult(self._fms, parsed_data, portals)
+        else:
+            return CommandResult(self._fms, parsed_data, portals)
+
+    def execute_stream(self, chunk_size=65536):
+        """
+        Streaming variant of :py:meth:`execute`. Each :py:class:`.Record`
+        is yielded as soon as it has been read from the response, so
+        the memory used does not depend on the size of the found set.
+
+        Args:
+            chunk_size (int): Maximum size in bytes of each chunk read
+              from the response.
+
+        Yields:
+            :py:class:`.Record`: Records in found set order.
+        """
+        query = self.get_query()
+        chunks = self._fms.execute_query_stream(query, chunk_size=chunk_size)
+
+        raw_items = DataGrammarParser().iterparse(chunks)
+        parsed_data = next(raw_items)
+
+        error_code = int(parsed_data.error.code)
+        # Either no error or record does not exist.
+        assert error_code in [0, 401], error_code
+
+        layout = self._fms.get_layout_for_response_(parsed_data)
+        for raw_record in raw_items:
+            yield CommandResult.create_record_(layout, raw_record)
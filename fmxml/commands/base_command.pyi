@@ -4,10 +4,13 @@
 # Stubs for fmxml.commands.base_command
 #
 import abc
+from typing import Iterator, Union
 
 from .. import fms as fms_module
 from ..commands import command_container as command_container_module
+from ..structure import columnar_result as columnar_result_module
 from ..structure import command_result as command_result_module
+from ..structure import record as record_module
 
 
 class BaseCommand0(abc.ABC):
@@ -39,5 +42,39 @@ class BaseCommand(BaseCommand1):
     def get_command_params(self) -> command_container_module.CommandContainer:
         ...
 
-    def execute(self) -> command_result_module.CommandResult:
+    def execute(self,
+                lazy: bool = ...,
+                portals: bool = ...,
+                columnar: bool = ...) \
+            -> Union[command_result_module.CommandResult,
+                     columnar_result_module.ColumnarResult]:
+        ...
+
+    def _execute_query(self,
+                       query: str,
+                       lazy: bool = ...,
+                       portals: bool = ...,
+                       columnar: bool = ...) \
+            -> Union[command_result_module.CommandResult,
+                     columnar_result_module.ColumnarResult]:
+        ...
+
+    async def execute_async(self,
+                            lazy: bool = ...,
+                            portals: bool = ...,
+                            columnar: bool = ...) \
+            -> Union[command_result_module.CommandResult,
+                     columnar_result_module.ColumnarResult]:
+        ...
+
+    def _create_result(self,
+                       xml_bytes: bytes,
+                       lazy: bool = ...,
+                       portals: bool = ...,
+                       columnar: bool = ...) \
+            -> Union[command_result_module.CommandResult,
+                     columnar_result_module.ColumnarResult]:
+        ...
+
+    def execute_stream(self, chunk_size: int = ...) -> Iterator[record_module.Record]:
         ...
@@ -3,6 +3,8 @@
 #
 # fmxml.commands.mixins.foundset_mixin
 #
+from concurrent.futures import ThreadPoolExecutor
+
 from .. import base_command as base_command_module
 
 
@@ -47,3 +49,129 @@ class FoundSetMixin(base_command_module.BaseCommand0):
         """
         assert max_ is None or max_ == 'all' or (isinstance(max_, int) and max_ >= 0)
         self._max = max_
+
+    def iter_records(self, page_size=100, prefetch=False, portals=True):
+        """
+        Generator that fetches the found set a page at a time using
+        successive –skip and –max query parameters, yielding the
+        :py:class:`.Record` instances as it goes. It stops at the end of
+        the found set.
+
+        Any skip set with :py:meth:`set_skip` is the starting point and
+        any numeric max set with :py:meth:`set_max` limits the total
+        number of records yielded. Neither is changed.
+
+        Args:
+            page_size (int): Number of records requested per page.
+            prefetch (bool): If true the next page is fetched in a
+              background thread whilst the current page is being consumed.
+            portals (bool): If false the portal records are not created.
+
+        Yields:
+            :py:class:`.Record`: Records in found set order.
+        """
+        assert isinstance(page_size, int) and page_size > 0
+
+        skip = self._skip
+        # None and 'all' are both unlimited.
+        limit = self._max if isinstance(self._max, int) else None
+
+        def fetch_page(query_):
+            return self._execute_query(query_, lazy=True, portals=portals)
+
+        executor = ThreadPoolExecutor(max_workers=1) if prefetch else None
+        try:
+            count = 0
+            page_max = page_size if limit is None else min(page_size, limit)
+            query = self._get_page_query(skip, page_max)
+            future = executor.submit(fetch_page, query) if executor else None
+
+            while page_max > 0:
+                command_result = future.result() if executor else fetch_page(query)
+                records = command_result.records
+
+                count += len(records)
+                skip += len(records)
+                more = (len(records) == page_max
+                        and skip < command_result.found_count
+                        and (limit is None or count < limit))
+
+                if more:
+                    page_max = page_size if limit is None else min(page_size, limit - count)
+                    query = self._get_page_query(skip, page_max)
+                    if executor:
+                        future = executor.submit(fetch_page, query)
+                else:
+                    page_max = 0
+
+                yield from records
+        finally:
+            if executor:
+                executor.shutdown(wait=True)
+
+    def execute_parallel(self, page_size=1000, max_workers=4, portals=True):
+        """
+        Fetch the whole found set as pages requested concurrently.
+
+        The first page is fetched on its own, which also gives the found
+        count. The remaining –skip/–max windows are then requested over a
+        pool of *max_workers* threads sharing the
+        :py:attr:`.FileMakerServer.requests_session`, each page being
+        parsed in its thread. The records are reassembled in found set
+        (i.e. sort) order.
+
+        Any skip set with :py:meth:`set_skip` is the starting point and
+        any numeric max set with :py:meth:`set_max` limits the total
+        number of records returned. Neither is changed.
+
+        Args:
+            page_size (int): Number of records requested per page.
+            max_workers (int): Maximum number of concurrent requests.
+            portals (bool): If false the portal records are not created.
+
+        Returns:
+            list: :py:class:`.Record` instances in found set order.
+        """
+        assert isinstance(page_size, int) and page_size > 0
+        assert isinstance(max_workers, int) and max_workers > 0
+
+        skip = self._skip
+        # None and 'all' are both unlimited.
+        limit = self._max if isinstance(self._max, int) else None
+
+        def fetch_page(query_):
+            return self._execute_query(query_, portals=portals)
+
+        page_max = page_size if limit is None else min(page_size, limit)
+        if not page_max:
+            return []
+
+        command_result = fetch_page(self._get_page_query(skip, page_max))
+        records = list(command_result.records)
+        if len(records) < page_max:
+            return records  # That was all of them.
+
+        end = command_result.found_count
+        if limit is not None:
+            end = min(end, skip + limit)
+
+        queries = [self._get_page_query(page_skip, min(page_size, end - page_skip))
+                   for page_skip in range(skip + len(records), end, page_size)]
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            # map() returns the results in the order of the queries.
+            for command_result in executor.map(fetch_page, queries):
+                records.extend(command_result.records)
+
+        return records
+
+    def _get_page_query(self, skip, max_):
+        """
+        The query with –skip and –max temporarily replaced.
+        """
+        saved = self._skip, self._max
+        try:
+            self._skip, self._max = skip, max_
+            return self.get_query()
+        finally:
+            self._skip, self._max = saved
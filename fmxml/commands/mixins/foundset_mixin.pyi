@@ -3,10 +3,11 @@
 #
 # Stubs for fmxml.commands.mixins.foundset_mixin
 #
-from typing import Union
+from typing import Union, Iterator, List
 
 from .. import command_container as command_container_module
 from ... import fms as fms_module
+from ...structure import record as record_module
 
 MaxType = Union[int, str, None]
 
@@ -38,3 +39,20 @@ class FoundSetMixin:
 
     def set_max(self, max_: MaxType = None) -> None:
         ...
+
+    def iter_records(self,
+                     page_size: int = ...,
+                     prefetch: bool = ...,
+                     portals: bool = ...) \
+            -> Iterator[record_module.Record]:
+        ...
+
+    def execute_parallel(self,
+                         page_size: int = ...,
+                         max_workers: int = ...,
+                         portals: bool = ...) \
+            -> List[record_module.Record]:
+        ...
+
+    def _get_page_query(self, skip: int, max_: int) -> str:
+        ...
@@ -4,6 +4,7 @@
 # fmxml.fms
 #
 import logging
+from contextlib import closing
 from urllib.parse import urlsplit, SplitResult, urlunsplit
 
 import requests
@@ -35,13 +36,20 @@ FMS_RELATEDSETS_FILTER_NONE = 'none'
 
 class FileMakerServer:
     __slots__ = ('_log', '_prop_lookup', '_requests_session', '_layout_lookup',
-                 '_hostspec', '_db_name', '_username', '_password',)
+                 '_hostspec', '_db_name', '_username', '_password', '_layout_cache',)
 
     def __init__(self,
                  hostspec,  # e.g. http://localhost
                  username,
                  password,
-                 db=None):
+                 db=None,
+                 layout_cache=None):
+        """
+        Args:
+            layout_cache: Optional :py:class:`.LayoutCache` shared with
+              other processes to avoid requesting the layout information
+              from the server.
+        """
         self._log = logging.getLogger(__name__)
         # self.log.info('FileMakerServer.__init__()')
         self._prop_lookup = {}
@@ -51,6 +59,7 @@ class FileMakerServer:
         self._password = None
         self._db_name = None
         self._requests_session = None
+        self._layout_cache = layout_cache
 
         self.hostspec = hostspec
         self.username = username
@@ -97,6 +106,10 @@ class FileMakerServer:
 
     password = property(fget=_get_password, fset=_set_password)
 
+    @property
+    def layout_cache(self):
+        return self._layout_cache
+
     def find_record_by_id(self, layout_name, record_id):
         assert isinstance(layout_name, str)
         assert isinstance(record_id, int)
@@ -150,23 +163,98 @@ class FileMakerServer:
         if layout_name in self._layout_lookup:
             return self._layout_lookup[layout_name]
 
-        command_params = [
-            Command('-db', self.db_name),
-            Command('-lay', layout_name),
-            Command('-view'),
-        ]
-        query = CommandContainer(*command_params).as_query()
+        layout = self.get_cached_layout_(layout_name)
+        if layout is None:
+            command_params = [
+                Command('-db', self.db_name),
+                Command('-lay', layout_name),
+                Command('-view'),
+            ]
+            query = CommandContainer(*command_params).as_query()
 
-        xml_bytes = self.execute_query(query)
-        assert xml_bytes
+            xml_bytes = self.execute_query(query)
+            assert xml_bytes
 
-        parser = DataGrammarParser()
-        parsed_data = parser.parse(xml_bytes)
-        layout = Layout(self, parsed_data)
+            parser = DataGrammarParser()
+            parsed_data = parser.parse(xml_bytes)
+            layout = Layout(self, parsed_data)
+            self.put_cached_layout_(parsed_data, layout)
 
         self._layout_lookup[layout_name] = layout
         return layout
 
+    def get_cached_layout_(self, layout_name):
+        """
+        Returns:
+            :py:class:`.Layout` constructed from the layout cache, or None
+            if there is no cache or no valid entry in it.
+        """
+        from .structure import Layout
+
+        if self._layout_cache is None:
+            return None
+
+        cached_layout = self._layout_cache.get(self.hostspec, self.db_name, layout_name)
+        if cached_layout is None:
+            return None
+
+        self._log.info(f'Layout "{layout_name}" loaded from the layout cache.')
+        return Layout(self, cached_layout.metadata, cached_layout.fmpxmllayout)
+
+    def put_cached_layout_(self, parsed_data, layout):
+        if self._layout_cache is not None:
+            self._layout_cache.put(self.hostspec, self.db_name, layout.name,
+                                   parsed_data, layout.get_fmpxmllayout_())
+
+    def put_cached_fmpxmllayout_(self, layout):
+        """
+        Add the value lists, which are loaded after the layout has been
+        created, to the layout cache entry (if any).
+        """
+        if self._layout_cache is not None:
+            self._layout_cache.put_fmpxmllayout(self.hostspec, self.db_name, layout.name,
+                                                layout.get_fmpxmllayout_())
+
+    def get_layout_for_response_(self, parsed_data):
+        """
+        Returns the :py:class:`.Layout` for a parsed fmresultset. The
+        layout already known by name (or in the layout cache) is used if
+        its datasource and field definitions are the same as those in the
+        response, otherwise a new layout is created from the response and
+        replaces it.
+
+        Args:
+            parsed_data: Parsed fmresultset from :py:class:`.DataGrammarParser`.
+
+        Returns:
+            :py:class:`.Layout`: Layout for the records in the response.
+        """
+        from .structure import Layout
+
+        layout_name = parsed_data.datasource.layout
+
+        layout = self._layout_lookup.get(layout_name)
+        if layout is not None and layout.matches_(parsed_data):
+            return layout
+
+        layout = self.get_cached_layout_(layout_name)
+        if layout is None or not layout.matches_(parsed_data):
+            layout = Layout(self, parsed_data)
+            self.put_cached_layout_(parsed_data, layout)
+
+        self._layout_lookup[layout_name] = layout
+        return layout
+
+    def invalidate_layout(self, layout_name):
+        """
+        Forget the layout information so that it is requested from the
+        server the next time that it is required. Also removes it from the
+        layout cache (if any).
+        """
+        self._layout_lookup.pop(layout_name, None)
+        if self._layout_cache is not None:
+            self._layout_cache.invalidate(self.hostspec, self.db_name, layout_name)
+
     def get_db_names(self):
         from .commands import Command
         commands = [
@@ -192,11 +280,16 @@ class FileMakerServer:
 
     def _get_names(self, commands):
         from .commands import CommandContainer
-        from .parsers import DataGrammarParser
 
         query = CommandContainer(*commands).as_query()
 
         xml_bytes = self.execute_query(query)
+        return self._parse_names(xml_bytes)
+
+    @staticmethod
+    def _parse_names(xml_bytes):
+        from .parsers import DataGrammarParser
+
         assert xml_bytes
 
         parser = DataGrammarParser()
@@ -213,6 +306,41 @@ class FileMakerServer:
             query: Query part of url created elsewhere. 
             xml_grammar: One of the available XML grammars. 
         """
+        xml_url = self._get_xml_url(query, xml_grammar)
+
+        resp = self.requests_session.get(url=xml_url, auth=(self.username, self.password))
+        resp.raise_for_status()  # promulgate errors from the bowels of requests
+
+        xml_bytes = resp.content
+
+        return xml_bytes
+
+    def execute_query_stream(self, query, xml_grammar='fmresultset', chunk_size=65536):
+        """
+        Streaming variant of :py:meth:`execute_query`. Rather than reading
+        the whole response into memory the response body is yielded in
+        chunks as it is received. Suitable for feeding to
+        :py:meth:`.DataGrammarParser.iterparse`.
+
+        Args:
+            query: Query part of url created elsewhere.
+            xml_grammar: One of the available XML grammars.
+            chunk_size (int): Maximum size of each chunk in bytes.
+
+        Yields:
+            bytes: Chunks of the XML response.
+        """
+        assert isinstance(chunk_size, int) and chunk_size > 0
+
+        xml_url = self._get_xml_url(query, xml_grammar)
+
+        resp = self.requests_session.get(url=xml_url, auth=(self.username, self.password),
+                                         stream=True)
+        with closing(resp):
+            resp.raise_for_status()  # promulgate errors from the bowels of requests
+            yield from resp.iter_content(chunk_size=chunk_size)
+
+    def _get_xml_url(self, query, xml_grammar):
         assert query
         assert isinstance(query, str)
         assert xml_grammar
@@ -227,13 +355,7 @@ class FileMakerServer:
         xml_url = urlunsplit(sr)
 
         self._log.info(xml_url)
-
-        resp = self.requests_session.get(url=xml_url, auth=(self.username, self.password))
-        resp.raise_for_status()  # promulgate errors from the bowels of requests
-
-        xml_bytes = resp.content
-
-        return xml_bytes
+        return xml_url
 
     @property
     def requests_session(self):
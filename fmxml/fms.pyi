@@ -4,10 +4,11 @@
 # Stubs for fmxml.fms
 #
 from logging import Logger
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Iterator
 
 import requests
 
+from .cache import layout_cache as layout_cache_module
 from .commands import command_container as command_container_module
 from .commands import delete_command as delete_command_module
 from .commands import dup_command as dup_command_module
@@ -48,12 +49,14 @@ class FileMakerServer:
     _password: str
     _db_name: str
     _requests_session: requests.sessions.Session
+    _layout_cache: Optional[layout_cache_module.LayoutCache]
 
     def __init__(self,
                  hostspec: str,
                  username: str,
                  password: str,
-                 db: Optional[str] = None) \
+                 db: Optional[str] = None,
+                 layout_cache: Optional[layout_cache_module.LayoutCache] = None) \
             -> None:
         ...
 
@@ -86,6 +89,9 @@ class FileMakerServer:
 
     db_name: Optional[str] = ...
 
+    @property
+    def layout_cache(self) -> Optional[layout_cache_module.LayoutCache]: ...
+
     def find_record_by_id(self,
                           layout_name: str,
                           record_id: int) \
@@ -125,6 +131,16 @@ class FileMakerServer:
 
     def get_layout(self, layout_name: str) -> layout_module.Layout: ...
 
+    def get_cached_layout_(self, layout_name: str) -> Optional[layout_module.Layout]: ...
+
+    def put_cached_layout_(self, parsed_data: Any, layout: layout_module.Layout) -> None: ...
+
+    def put_cached_fmpxmllayout_(self, layout: layout_module.Layout) -> None: ...
+
+    def get_layout_for_response_(self, parsed_data: Any) -> layout_module.Layout: ...
+
+    def invalidate_layout(self, layout_name: str) -> None: ...
+
     def get_db_names(self) -> List[str]: ...
 
     def get_layout_names(self) -> List[str]: ...
@@ -133,8 +149,19 @@ class FileMakerServer:
 
     def _get_names(self, commands: List[command_container_module.Command]) -> List[str]: ...
 
+    @staticmethod
+    def _parse_names(xml_bytes: bytes) -> List[str]: ...
+
     def execute_query(self, query: str, xml_grammar: str = ...) -> bytes: ...
 
+    def execute_query_stream(self,
+                             query: str,
+                             xml_grammar: str = ...,
+                             chunk_size: int = ...) \
+            -> Iterator[bytes]: ...
+
+    def _get_xml_url(self, query: str, xml_grammar: str) -> str: ...
+
     @property
     def requests_session(self) -> Optional[requests.sessions.Session]: ...
 
@@ -105,16 +105,62 @@ class DataGrammarParser(GrammarParserBase):
             parser.feed(xml_bytes)
             return self._parser_read_events(parser)
 
+    def iterparse(self, chunks):
+        """
+        Streaming variant of :py:meth:`parse`. The XML is fed to the
+        parser a chunk at a time, as it arrives, and the records are
+        yielded as soon as each ``</record>`` has been read. Records that
+        have been yielded are not retained by the parser so memory use
+        does not grow with the size of the found set.
+
+        The first item yielded is the :py:class:`RawFMResultSet`. By then
+        the error, product, datasource and field definitions have all been
+        read. Its ``resultset.records`` is left empty. Every subsequent
+        item is a top level :py:class:`RawRecord` (portal records are
+        attached to their parent record as usual).
+
+        Args:
+            chunks: Iterable of byte strings of XML data, for example
+              ``requests.Response.iter_content()``.
+
+        Yields:
+            :py:class:`RawFMResultSet` followed by :py:class:`RawRecord`
+              instances.
+        """
+        parser = XMLPullParser(['start', 'end', 'start-ns', 'end-ns'])  # ignore 'comment' & 'pi'
+
+        with closing(parser) as parser:
+            yield from self._iter_read_events(self._iter_feed(parser, chunks), stream=True)
+
     @staticmethod
-    def _parser_read_events(parser):
+    def _iter_feed(parser, chunks):
+        for chunk in chunks:
+            if chunk:
+                parser.feed(chunk)
+                yield from parser.read_events()
+
+    @classmethod
+    def _parser_read_events(cls, parser):
+        for fmresultset in cls._iter_read_events(parser.read_events(), stream=False):
+            return fmresultset
+
+    @staticmethod
+    def _iter_read_events(events, stream):
+        """
+        Without *stream* the completed :py:class:`RawFMResultSet` is
+        yielded once, at the end of the document. With *stream* the
+        :py:class:`RawFMResultSet` is yielded when the resultset element
+        starts, followed by each top level record when it ends.
+        """
         table_name = None  # type: str
         parent_raw_record = None  # type: RawRecord
         current_raw_record = None  # type: RawRecord
+        resultset_elem = None  # For releasing streamed records.
 
         ns = ''  # For removal of element tag namespace.
         nsl = 0  # Length of ns
 
-        for event, elem in parser.read_events():
+        for event, elem in events:
 
             if event == 'start-ns':
                 # elem == (prefix, namespaceURI)
@@ -139,7 +185,12 @@ class DataGrammarParser(GrammarParserBase):
                 if event == 'start':
                     fmresultset = RawFMResultSet(elem)
                 elif event == 'end':
-                    return fmresultset
+                    if not stream:
+                        yield fmresultset
+                    elif resultset_elem is None:
+                        # No resultset, so nothing has been yielded yet.
+                        yield fmresultset
+                    return
 
             elif elem.tag == 'error':
                 if event == 'start':
@@ -183,6 +234,10 @@ class DataGrammarParser(GrammarParserBase):
                 if event == 'start':
                     raw_resultset = RawResultSet(elem)
                     fmresultset.resultset = raw_resultset
+                    if stream:
+                        # The metadata precedes the resultset (see the DTD).
+                        resultset_elem = elem
+                        yield fmresultset
 
             elif elem.tag == 'relatedset':
                 if event == 'start':
@@ -202,7 +257,12 @@ class DataGrammarParser(GrammarParserBase):
 
                 elif event == 'end':
                     if table_name is None:
-                        fmresultset.resultset.records.append(current_raw_record)
+                        if stream:
+                            # Release the element tree of the record.
+                            resultset_elem.clear()
+                            yield current_raw_record
+                        else:
+                            fmresultset.resultset.records.append(current_raw_record)
                     else:
                         parent_raw_record.relatedsets[table_name].append(current_raw_record)
                     current_raw_record = None
@@ -3,7 +3,7 @@
 #
 # Stubs for fmxml.parsers.data_grammar
 #
-from typing import Optional, List, NamedTuple, Dict
+from typing import Optional, List, NamedTuple, Dict, Iterable, Iterator, Tuple, Union, Any
 from xml.etree.ElementTree import Element, XMLPullParser
 
 from .grammar_base import ElemInitialiser
@@ -74,8 +74,21 @@ class DataGrammarParser(GrammarParserBase):
     def parse(self, xml_bytes: bytes) -> RawFMResultSet:
         ...
 
+    def iterparse(self, chunks: Iterable[bytes]) -> Iterator[Union[RawFMResultSet, RawRecord]]:
+        ...
+
+    @staticmethod
+    def _iter_feed(parser: XMLPullParser, chunks: Iterable[bytes]) -> Iterator[Tuple[str, Any]]:
+        ...
+
+    @classmethod
+    def _parser_read_events(cls, parser: XMLPullParser) -> RawFMResultSet:
+        ...
+
     @staticmethod
-    def _parser_read_events(parser: XMLPullParser) -> RawFMResultSet:
+    def _iter_read_events(events: Iterable[Tuple[str, Any]],
+                          stream: bool) \
+            -> Iterator[Union[RawFMResultSet, RawRecord]]:
         ...
 
 
@@ -3,7 +3,8 @@
 #
 # fmxml.structure.__init__
 #
-from .command_result import CommandResult
+from .command_result import CommandResult, LazyCommandResult, RecordSequence
+from .columnar_result import ColumnarResult
 from .field import Field
 from .field_container import FieldContainer
 from .layout import Layout
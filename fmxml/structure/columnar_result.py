@@ -0,0 +1,201 @@
+#
+# coding: utf-8
+#
+# fmxml.structure.columnar_result
+#
+import re
+from array import array
+
+from . import field_definition as fd_module
+
+try:
+    import numpy
+except ImportError:  # pragma: no cover
+    numpy = None
+
+# Whole numbers that can be stored in array('q')
+_INTEGER_RE = re.compile(r'\A[+-]?[0-9]+\Z')
+
+
+class ColumnarResult:
+    """
+    Alternative to :py:class:`.CommandResult` for analytics. Rather than
+    a :py:class:`.Record` per row there is one column per field (and
+    repetition) holding the values of that field for every record.
+
+    No :py:class:`.Record`, :py:class:`.FieldContainer` or
+    :py:class:`.Field` instances are created. The munging is decided once
+    per column from the :py:class:`.FieldDefinition`. Number columns of
+    whole numbers are stored as ``array('q')``, everything else as a list.
+
+    Portal records are not included.
+    """
+    __slots__ = ('_fms', '_error_code', '_layout', '_found_count',
+                 '_fetch_size', '_total_count', '_record_ids',
+                 '_modification_ids', '_columns',)
+
+    def __init__(self, fms, parsed_data, raw_records=None):
+        """
+        Args:
+            fms: :py:class:`.FileMakerServer` instance.
+            parsed_data: Parsed fmresultset from :py:class:`.DataGrammarParser`.
+            raw_records: Optional iterable of raw records, for example
+              from :py:meth:`.DataGrammarParser.iterparse`. Defaults to
+              the records in *parsed_data*.
+        """
+        self._fms = fms
+
+        self._error_code = int(parsed_data.error.code)
+        # Either no error or record does not exist.
+        assert self._error_code in [0, 401], self._error_code
+
+        self._layout = self._fms.get_layout_for_response_(parsed_data)
+
+        datasource = parsed_data.datasource
+        self._total_count = int(datasource.total_count)
+
+        resultset = parsed_data.resultset
+        self._found_count = int(resultset.count)
+        self._fetch_size = int(resultset.fetch_size)
+
+        if raw_records is None:
+            raw_records = resultset.records
+
+        self._record_ids = array('q')
+        self._modification_ids = array('q')
+        # {field_name: [[value, ...], ...]} - one list per repetition
+        raw_columns = {raw_field_definition.name: []
+                       for raw_field_definition in parsed_data.field_definitions}
+
+        for idx, raw_record in enumerate(raw_records):
+            self._record_ids.append(int(raw_record.record_id))
+            self._modification_ids.append(int(raw_record.modification_id))
+
+            for raw_field in raw_record.fields:
+                repetitions = raw_columns[raw_field.name]
+                for repetition_number, data in enumerate(raw_field.data):
+                    if repetition_number == len(repetitions):
+                        repetitions.append([])
+                    column = repetitions[repetition_number]
+                    # Repetitions are not always present, pad with None.
+                    if len(column) < idx:
+                        column.extend([None] * (idx - len(column)))
+                    column.append(data)
+
+        row_count = len(self._record_ids)
+        self._columns = {}
+        for field_name, repetitions in raw_columns.items():
+            field_definition = self._layout.get_field_definition(field_name)
+            if not repetitions:
+                repetitions.append([])
+            munged_repetitions = []
+            for column in repetitions:
+                if len(column) < row_count:
+                    column.extend([None] * (row_count - len(column)))
+                munged_repetitions.append(_munge_column(field_definition, column))
+            self._columns[field_name] = munged_repetitions
+
+    @property
+    def layout(self):
+        return self._layout
+
+    @property
+    def field_names(self):
+        return list(self._columns)
+
+    @property
+    def total_count(self):
+        return self._total_count
+
+    @property
+    def found_count(self):
+        return self._found_count
+
+    @property
+    def fetch_size(self):
+        return self._fetch_size
+
+    @property
+    def record_ids(self):
+        return self._record_ids
+
+    @property
+    def modification_ids(self):
+        return self._modification_ids
+
+    def __len__(self):
+        return len(self._record_ids)
+
+    def get_column(self, field_name, repetition_number=0):
+        """
+        Args:
+            field_name (str): Name of the field.
+            repetition_number (int): Zero based repetition.
+
+        Returns:
+            The values of the field, one per record, in found set order.
+        """
+        return self._columns[field_name][repetition_number]
+
+    def get_columns(self, field_name):
+        """
+        Returns:
+            list: A column for each repetition of the field.
+        """
+        return list(self._columns[field_name])
+
+    def to_numpy(self, field_name, repetition_number=0):
+        """
+        Convert a column to a NumPy array. Number columns become ``int64``
+        (whole numbers) or ``float64`` arrays, date and timestamp columns
+        become ``datetime64`` arrays. Empty values become ``nan`` or ``NaT``.
+        Anything else is returned as an ``object`` array.
+
+        Requires NumPy to be installed.
+        """
+        if numpy is None:
+            raise ImportError('NumPy is required for ColumnarResult.to_numpy()')
+
+        column = self.get_column(field_name, repetition_number)
+        result = self._layout.get_field_definition(field_name).result
+
+        if isinstance(column, array):
+            return numpy.array(column, dtype=numpy.int64)
+
+        if result == fd_module.RESULT_NUMBER:
+            try:
+                return numpy.array([numpy.nan if value is None or value == '' else float(value)
+                                    for value in column], dtype=numpy.float64)
+            except (TypeError, ValueError):
+                pass
+        elif result in {fd_module.RESULT_DATE, fd_module.RESULT_TIMESTAMP}:
+            dtype = 'datetime64[D]' if result == fd_module.RESULT_DATE else 'datetime64[s]'
+            try:
+                return numpy.array(['NaT' if value is None or value == '' else value
+                                    for value in column], dtype=dtype)
+            except (TypeError, ValueError):
+                pass
+
+        return numpy.array(column, dtype=object)
+
+
+def _munge_column(field_definition, column):
+    """
+    Munge a whole column of raw values. The decision as to how the values
+    are to be converted is made once for the column.
+    """
+    if (field_definition.type != 'normal'
+            or field_definition.result in {fd_module.RESULT_TEXT,
+                                           fd_module.RESULT_CONTAINER,
+                                           fd_module.RESULT_UNKNOWN, }):
+        # Nothing to convert.
+        return column
+
+    if field_definition.result == fd_module.RESULT_NUMBER:
+        if all(value is not None and _INTEGER_RE.match(value) for value in column):
+            try:
+                return array('q', map(int, column))
+            except OverflowError:
+                pass
+
+    return list(map(field_definition.munge_value, column))
@@ -0,0 +1,70 @@
+#
+# coding: utf-8
+#
+# Stubs for fmxml.structure.columnar_result
+#
+from array import array
+from typing import List, Dict, Iterable, Optional, Any, Union, Pattern
+
+from . import field_definition as field_definition_module
+from . import layout as layout_module
+from .. import fms as fms_module
+from ..parsers import data_grammar as data_grammar_module
+
+_INTEGER_RE: Pattern[str] = ...
+
+Column = Union[array, List[Any]]
+
+
+class ColumnarResult:
+    _fms: fms_module.FileMakerServer
+    _error_code: int
+    _layout: layout_module.Layout
+    _total_count: int
+    _found_count: int
+    _fetch_size: int
+    _record_ids: array
+    _modification_ids: array
+    _columns: Dict[str, List[Column]]
+
+    def __init__(self,
+                 fms: fms_module.FileMakerServer,
+                 parsed_data: data_grammar_module.RawFMResultSet,
+                 raw_records: Optional[Iterable[data_grammar_module.RawRecord]] = ...) \
+            -> None:
+        ...
+
+    @property
+    def layout(self) -> layout_module.Layout: ...
+
+    @property
+    def field_names(self) -> List[str]: ...
+
+    @property
+    def total_count(self) -> int: ...
+
+    @property
+    def found_count(self) -> int: ...
+
+    @property
+    def fetch_size(self) -> int: ...
+
+    @property
+    def record_ids(self) -> array: ...
+
+    @property
+    def modification_ids(self) -> array: ...
+
+    def __len__(self) -> int: ...
+
+    def get_column(self, field_name: str, repetition_number: int = ...) -> Column: ...
+
+    def get_columns(self, field_name: str) -> List[Column]: ...
+
+    def to_numpy(self, field_name: str, repetition_number: int = ...) -> Any: ...
+
+
+def _munge_column(field_definition: field_definition_module.FieldDefinition,
+                  column: List[Optional[str]]) \
+        -> Column:
+    ...
@@ -3,9 +3,9 @@
 #
 # fmxml.structure.command_result
 #
+import collections.abc
 from collections import Counter
 
-from . import layout as layout_module
 from . import record as record_module
 
 
@@ -13,14 +13,14 @@ class CommandResult:
     __slots__ = ('_fms', '_error_code', '_layout', '_found_count',
                  '_fetch_size', '_records', '_total_count',)
 
-    def __init__(self, fms, parsed_data):
+    def __init__(self, fms, parsed_data, portals=True):
         self._fms = fms
 
         self._error_code = int(parsed_data.error.code)
         # Either no error or record does not exist.
         assert self._error_code in [0, 401], self._error_code
 
-        self._layout = layout_module.Layout(self._fms, parsed_data)
+        self._layout = self._fms.get_layout_for_response_(parsed_data)
 
         datasource = parsed_data.datasource
         self._total_count = int(datasource.total_count)
@@ -31,18 +31,7 @@ class CommandResult:
 
         record_list = []
         for raw_record in resultset.records:
-            new_record = self._create_new_record(self._layout, raw_record)
-
-            # portal
-            if raw_record.relatedsets:
-                for table_name, portal_raw_records in raw_record.relatedsets.items():
-                    for portal_raw_record in portal_raw_records:
-                        new_portal_record = self._create_new_record(
-                            self._layout,
-                            portal_raw_record)
-                        new_record.add_portal_record_(table_name, new_portal_record)
-
-            record_list.append(new_record)
+            record_list.append(self.create_record_(self._layout, raw_record, portals))
 
         self._records = record_list
 
@@ -56,11 +45,11 @@ class CommandResult:
 
     @property
     def field_names(self):
-        return self._layout.field_names
+        return self.layout.field_names
 
     @property
     def portal_names(self):
-        return self._layout.portal_names
+        return self.layout.portal_names
 
     @property
     def total_count(self):
@@ -74,12 +63,33 @@ class CommandResult:
     def fetch_size(self):
         return self._fetch_size
 
-    def _create_new_record(self, layout_or_portal, raw_record):
+    @classmethod
+    def create_record_(cls, layout, raw_record, portals=True):
+        """
+        Create a :py:class:`.Record`, complete with any portal records,
+        from a raw record obtained from :py:class:`.DataGrammarParser`.
+        The portal records are omitted if *portals* is false.
+        """
+        new_record = cls._create_new_record(layout, raw_record)
+
+        # portal
+        if portals and raw_record.relatedsets:
+            for table_name, portal_raw_records in raw_record.relatedsets.items():
+                for portal_raw_record in portal_raw_records:
+                    new_portal_record = cls._create_new_record(
+                        layout,
+                        portal_raw_record)
+                    new_record.add_portal_record_(table_name, new_portal_record)
+
+        return new_record
+
+    @classmethod
+    def _create_new_record(cls, layout_or_portal, raw_record):
         """
         Helper function, eliminates duplicate code. This is used for both
         layout and portal.
         """
-        field_container = self._raw_record_field_factory(layout_or_portal, raw_record.fields)
+        field_container = cls._raw_record_field_factory(layout_or_portal, raw_record.fields)
         record: record_module.Record = record_module.Record(layout_or_portal, field_container)
         record.record_id = int(raw_record.record_id)
         record.modification_id = int(raw_record.modification_id)
@@ -119,3 +129,89 @@ class CommandResult:
                 repetition_number: field_value
                 for repetition_number, field_value in enumerate(field_value_sequence)}
         return FieldContainer(layout, field_value_dict)
+
+
+class LazyCommandResult(CommandResult):
+    """
+    A :py:class:`CommandResult` that does no more than is asked of it.
+
+    The counts are available immediately. The :py:class:`.Layout` is only
+    created when it is first required and each :py:class:`.Record` is
+    only created when it is indexed or iterated over - see
+    :py:class:`RecordSequence`.
+    """
+    __slots__ = ('_parsed_data', '_portals',)
+
+    def __init__(self, fms, parsed_data, portals=True):
+        self._fms = fms
+
+        self._error_code = int(parsed_data.error.code)
+        # Either no error or record does not exist.
+        assert self._error_code in [0, 401], self._error_code
+
+        self._layout = None
+        self._records = None
+        self._parsed_data = parsed_data
+        self._portals = portals
+
+        datasource = parsed_data.datasource
+        self._total_count = int(datasource.total_count)
+
+        resultset = parsed_data.resultset
+        self._found_count = int(resultset.count)
+        self._fetch_size = int(resultset.fetch_size)
+
+    @property
+    def layout(self):
+        if self._layout is None:
+            self._layout = self._fms.get_layout_for_response_(self._parsed_data)
+        return self._layout
+
+    @property
+    def records(self):
+        if self._records is None:
+            self._records = RecordSequence(self.layout,
+                                           self._parsed_data.resultset.records,
+                                           self._portals)
+        return self._records
+
+
+class RecordSequence(collections.abc.Sequence):
+    """
+    Read only sequence of :py:class:`.Record` instances. Each
+    :py:class:`.Record` is created from its raw record the first time it
+    is indexed and the same instance is returned thereafter. The raw
+    record is released once its :py:class:`.Record` has been created.
+
+    Slicing returns a list.
+    """
+    __slots__ = ('_layout', '_raw_records', '_records', '_portals',)
+
+    def __init__(self, layout, raw_records, portals=True):
+        self._layout = layout
+        self._raw_records = list(raw_records)
+        self._records = [None] * len(self._raw_records)
+        self._portals = portals
+
+    def __getitem__(self, item):
+        if isinstance(item, slice):
+            return [self[idx] for idx in range(*item.indices(len(self)))]
+
+        record = self._records[item]
+        if record is None:
+            record = CommandResult.create_record_(self._layout,
+                                                  self._raw_records[item],
+                                                  self._portals)
+            self._records[item] = record
+            self._raw_records[item] = None
+        return record
+
+    def __len__(self):
+        return len(self._records)
+
+    def __iter__(self):
+        for idx in range(len(self)):
+            yield self[idx]
+
+    def __repr__(self):
+        return f'RecordSequence(layout={self._layout.name!r}, len={len(self)})'
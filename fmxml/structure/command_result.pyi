@@ -3,7 +3,8 @@
 #
 # Stubs for fmxml.structure.command_result
 #
-from typing import List
+import collections.abc
+from typing import List, Sequence, Iterator, Union, Optional
 
 from . import layout as layout_module
 from . import record as record_module
@@ -19,11 +20,12 @@ class CommandResult:
     _total_count: int
     _found_count: int
     _fetch_size: int
-    _records: List[record_module.Record]
+    _records: Sequence[record_module.Record]
 
     def __init__(self,
                  fms: fms_module.FileMakerServer,
-                 parsed_data: data_grammar_module.RawFMResultSet) \
+                 parsed_data: data_grammar_module.RawFMResultSet,
+                 portals: bool = ...) \
             -> None:
         ...
 
@@ -31,7 +33,7 @@ class CommandResult:
     def layout(self) -> layout_module.Layout: ...
 
     @property
-    def records(self) -> List[record_module.Record]: ...
+    def records(self) -> Sequence[record_module.Record]: ...
 
     @property
     def field_names(self) -> List[str]: ...
@@ -48,7 +50,16 @@ class CommandResult:
     @property
     def fetch_size(self) -> int: ...
 
-    def _create_new_record(self,
+    @classmethod
+    def create_record_(cls,
+                       layout: layout_module.Layout,
+                       raw_record: data_grammar_module.RawRecord,
+                       portals: bool = ...) \
+            -> record_module.Record:
+        ...
+
+    @classmethod
+    def _create_new_record(cls,
                            layout: layout_module.Layout,
                            raw_record: data_grammar_module.RawRecord) \
             -> record_module.Record:
@@ -59,3 +70,42 @@ class CommandResult:
                                   raw_record_fields: List[data_grammar_module.RawField]) \
             -> field_container_module.FieldContainer:
         ...
+
+
+class LazyCommandResult(CommandResult):
+    _layout: Optional[layout_module.Layout]
+    _records: Optional[RecordSequence]
+    _parsed_data: data_grammar_module.RawFMResultSet
+    _portals: bool
+
+    def __init__(self,
+                 fms: fms_module.FileMakerServer,
+                 parsed_data: data_grammar_module.RawFMResultSet,
+                 portals: bool = ...) \
+            -> None:
+        ...
+
+    @property
+    def records(self) -> RecordSequence: ...
+
+
+class RecordSequence(collections.abc.Sequence):
+    _layout: layout_module.Layout
+    _raw_records: List[Optional[data_grammar_module.RawRecord]]
+    _records: List[Optional[record_module.Record]]
+    _portals: bool
+
+    def __init__(self,
+                 layout: layout_module.Layout,
+                 raw_records: List[data_grammar_module.RawRecord],
+                 portals: bool = ...) \
+            -> None:
+        ...
+
+    def __getitem__(self, item: Union[int, slice]) \
+            -> Union[record_module.Record, List[record_module.Record]]:
+        ...
+
+    def __len__(self) -> int: ...
+
+    def __iter__(self) -> Iterator[record_module.Record]: ...
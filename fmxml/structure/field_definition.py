@@ -88,6 +88,26 @@ class FieldDefinition:
         """
         return self._layout
 
+    @property
+    def type(self):
+        """
+        Returns:
+          One of :py:data:`KNOWN_TYPES`.
+        """
+        return self._type
+
+    @property
+    def result(self):
+        """
+        Returns:
+          One of :py:data:`KNOWN_RESULTS`.
+        """
+        return self._result
+
+    @property
+    def max_repetitions(self):
+        return self._max_repetitions
+
     def munge_value(self, value):
         """
         Create a suitable internal representation of the value. If it value
@@ -180,6 +200,8 @@ class FieldDefinition:
         self._valuelist_name = valuelist_name
 
     def get_valuelist(self):
+        # The value list names are set when the value lists are loaded.
+        self._layout.load_valuelists_()
         if self._valuelist_name is None:
             return None
         else:
@@ -53,6 +53,18 @@ class FieldDefinition:
     def layout(self) -> layout_module.Layout:
         ...
 
+    @property
+    def type(self) -> str:
+        ...
+
+    @property
+    def result(self) -> str:
+        ...
+
+    @property
+    def max_repetitions(self) -> int:
+        ...
+
     def munge_value(self, value: Optional[str]) -> Any:
         ...
 
@@ -21,9 +21,20 @@ class Layout:
                  '_timestamp_format',
                  '_field_definition_lookup',
                  '_valuelists',
-                 '_portals',)
+                 '_portals',
+                 '_fmpxmllayout',
+                 '_signature',)
 
-    def __init__(self, fms, parsed_data):
+    def __init__(self, fms, parsed_data, fmpxmllayout=None):
+        """
+        Args:
+            fms: :py:class:`.FileMakerServer` instance.
+            parsed_data: Parsed fmresultset (or the cached
+              :py:data:`.LayoutMetadata`) with the field definitions.
+            fmpxmllayout: Optional parsed FMPXMLLAYOUT grammar, for example
+              from a :py:class:`.LayoutCache`. If not given it is requested
+              from the server when the value lists are first required.
+        """
 
         self._fms = fms
         self._field_definition_lookup = OrderedDict()
@@ -36,6 +47,7 @@ class Layout:
         self._date_format = datasource.date_format
         self._time_format = datasource.time_format
         self._timestamp_format = datasource.timestamp_format
+        self._signature = get_definitions_signature_(parsed_data)
 
         field_definitions = parsed_data.field_definitions
         for field_definition in field_definitions:
@@ -60,7 +72,9 @@ class Layout:
 
             self._add_portal(portal.table_name, portal)
 
-        self._load_fmpxmllayout()
+        self._fmpxmllayout = None
+        if fmpxmllayout is not None:
+            self._load_fmpxmllayout(fmpxmllayout)
 
     @property
     def fms(self):
@@ -92,38 +106,49 @@ class Layout:
         return list(self._field_definition_lookup)
 
     def get_valuelist(self, valuelist_name):
+        self.load_valuelists_()
         return self._valuelists[valuelist_name]
 
-    def _load_fmpxmllayout(self):
+    def matches_(self, parsed_data):
         """
-        Load the value lists (if any). This only happens when the layout
-        is loaded. Each layout is only loaded once (by name).
+        Returns:
+            bool: True if the datasource and the field definitions of the
+              parsed fmresultset are those that this layout was created
+              from, i.e. this layout can be used for the response.
         """
-        # The manual states that 'record_id' can be used as a
-        # parameter, though there's no need here...
-        record_id = None
+        return self._signature == get_definitions_signature_(parsed_data)
 
-        if record_id:
-            # The manual (page 55) says you can do this...
-            command_params = [
-                commands_module.Command('-db', self._fms.db_name),
-                commands_module.Command('-lay', self._name),
-                commands_module.Command('-recid', record_id),
-                commands_module.Command('-view'), ]
-        else:
-            # But as the layer is being read, only this is required...
-            command_params = [
-                commands_module.Command('-db', self._fms.db_name),
-                commands_module.Command('-lay', self._name),
-                commands_module.Command('-view'), ]
+    def load_valuelists_(self):
+        """
+        Load the value lists from the FMPXMLLAYOUT grammar if that has not
+        already been done.
+        """
+        if self._fmpxmllayout is None:
+            self._load_fmpxmllayout()
+            self._fms.put_cached_fmpxmllayout_(self)
 
-        # ------------------------------------------------- read in the grammar
-        query = commands_module.CommandContainer(*command_params).as_query()
-        xml_bytes = self._fms.execute_query(query, xml_grammar='FMPXMLLAYOUT')
-        assert xml_bytes
+    def get_fmpxmllayout_(self):
+        """
+        Returns:
+            The parsed FMPXMLLAYOUT grammar that the value lists were
+            loaded from.
+        """
+        return self._fmpxmllayout
 
-        parser = parsers_module.InfoGrammarParser()
-        fmpxmllayout = parser.parse(xml_bytes)
+    def _load_fmpxmllayout(self, fmpxmllayout=None):
+        """
+        Load the value lists (if any). This only happens when the value
+        lists are first required. Each layout is only loaded once (by name).
+        """
+        # ------------------------------------------------- read in the grammar
+        if fmpxmllayout is None:
+            query = self.get_fmpxmllayout_query_(self._fms.db_name, self._name)
+            xml_bytes = self._fms.execute_query(query, xml_grammar='FMPXMLLAYOUT')
+            assert xml_bytes
+
+            parser = parsers_module.InfoGrammarParser()
+            fmpxmllayout = parser.parse(xml_bytes)
+        self._fmpxmllayout = fmpxmllayout
         # ---------------------------------------- add the value lists (if any)
         for raw_field in fmpxmllayout.layout.raw_fields:
             # style_type = raw_field.style.type_
@@ -139,6 +164,32 @@ class Layout:
 
             self._valuelists[name] = valuelist_module.Valuelist(name, raw_values)
 
+    @staticmethod
+    def get_fmpxmllayout_query_(db_name, layout_name):
+        """
+        Returns:
+            The query for the FMPXMLLAYOUT grammar of the layout.
+        """
+        # The manual states that 'record_id' can be used as a
+        # parameter, though there's no need here...
+        record_id = None
+
+        if record_id:
+            # The manual (page 55) says you can do this...
+            command_params = [
+                commands_module.Command('-db', db_name),
+                commands_module.Command('-lay', layout_name),
+                commands_module.Command('-recid', record_id),
+                commands_module.Command('-view'), ]
+        else:
+            # But as the layer is being read, only this is required...
+            command_params = [
+                commands_module.Command('-db', db_name),
+                commands_module.Command('-lay', layout_name),
+                commands_module.Command('-view'), ]
+
+        return commands_module.CommandContainer(*command_params).as_query()
+
     @property
     def date_format(self):
         return self._date_format
@@ -157,3 +208,28 @@ class Layout:
     @property
     def portal_names(self):
         return list(self._portals)
+
+
+def get_definitions_signature_(parsed_data):
+    """
+    Returns:
+        tuple: Hashable summary of the datasource and the field
+          definitions of a parsed fmresultset, excluding anything that
+          varies between responses such as the counts.
+    """
+
+    def get_signature(raw_field_definitions):
+        return tuple(tuple(getattr(raw_field_definition, name, None)
+                           for name in raw_field_definition.__slots__)
+                     for raw_field_definition in raw_field_definitions)
+
+    datasource = parsed_data.datasource
+    return (datasource.database,
+            datasource.layout,
+            datasource.table,
+            datasource.date_format,
+            datasource.time_format,
+            datasource.timestamp_format,
+            get_signature(parsed_data.field_definitions),
+            tuple((table_name, get_signature(field_definitions))
+                  for table_name, field_definitions in parsed_data.relatedset_definitions.items()))
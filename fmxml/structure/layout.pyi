@@ -3,13 +3,14 @@
 #
 # Stubs for fmxml.structure.layout
 #
-from typing import Dict, List
+from typing import Any, Dict, List, Optional, Tuple
 
 from . import field_definition as field_definition_module
 from . import portal as portal_module
 from . import valuelist as valuelist_module
 from .. import fms as fms_module
 from ..parsers import data_grammar as data_grammar_module
+from ..parsers import info_grammar as info_grammar_module
 
 
 class Layout:
@@ -22,10 +23,13 @@ class Layout:
     _field_definition_lookup: Dict[str, field_definition_module.FieldDefinition] 
     _valuelists: Dict[str, valuelist_module.Valuelist] 
     _portals: Dict[str, portal_module.Portal] 
+    _fmpxmllayout: Optional[info_grammar_module.RawFMPXMLLayout]
+    _signature: Tuple[Any, ...]
 
     def __init__(self,
                  fms: fms_module.FileMakerServer,
-                 parsed_data: data_grammar_module.RawFMResultSet) \
+                 parsed_data: Any,  # RawFMResultSet or LayoutMetadata
+                 fmpxmllayout: Optional[info_grammar_module.RawFMPXMLLayout] = ...) \
             -> None:
         ...
 
@@ -54,7 +58,22 @@ class Layout:
     def get_valuelist(self, valuelist_name: str) -> valuelist_module.Valuelist:
         ...
 
-    def _load_fmpxmllayout(self) -> None:
+    def matches_(self, parsed_data: Any) -> bool:
+        ...
+
+    def load_valuelists_(self) -> None:
+        ...
+
+    def get_fmpxmllayout_(self) -> Optional[info_grammar_module.RawFMPXMLLayout]:
+        ...
+
+    def _load_fmpxmllayout(self,
+                           fmpxmllayout: Optional[info_grammar_module.RawFMPXMLLayout] = ...) \
+            -> None:
+        ...
+
+    @staticmethod
+    def get_fmpxmllayout_query_(db_name: str, layout_name: str) -> str:
         ...
 
     @property
@@ -78,3 +97,7 @@ class Layout:
     @property
     def portal_names(self) -> List[str]:
         ...
+
+
+def get_definitions_signature_(parsed_data: Any) -> Tuple[Any, ...]:
+    ...
@@ -5,7 +5,7 @@ from setuptools import setup
 setup(
     name='fmxml',
     version='0.1.10',
-    packages=['fmxml', 'fmxml.parsers', 'fmxml.commands', 'fmxml.commands.mixins', 'fmxml.structure'],
+    packages=['fmxml', 'fmxml.parsers', 'fmxml.commands', 'fmxml.commands.mixins', 'fmxml.structure', 'fmxml.cache'],
     url='https://github.com/recombinant/fmxml',
     license='',
     author='stephen',
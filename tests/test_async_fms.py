@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+# coding: utf-8
+#
+# test_async_fms
+#
+"""
+Tests AsyncFileMakerServer against a local aiohttp server that serves the
+responses in tests/data.
+"""
+import asyncio
+import logging
+from pathlib import Path
+
+import pytest
+
+from fmxml import AsyncFileMakerServer
+from fmxml.structure import Record
+
+aiohttp = pytest.importorskip('aiohttp')
+from aiohttp import web  # noqa: E402
+
+__author__ = "recombinant"
+__copyright__ = "recombinant"
+__license__ = "BSD"
+
+
+def _run_with_server(coroutine_function):
+    queries = []
+
+    async def handle_xml(request):
+        assert request.headers['Authorization'].startswith('Basic ')
+        xml_grammar = request.match_info['xml_grammar']
+        xml_path = Path(__file__).parent / 'data' / f'{xml_grammar}{request.query_string}.xml'
+        if not xml_path.is_file():
+            raise web.HTTPNotFound()
+        queries.append((xml_grammar, request.query_string))
+        return web.Response(body=xml_path.read_bytes(), content_type='text/xml')
+
+    async def main():
+        app = web.Application()
+        app.router.add_get('/fmi/xml/{xml_grammar}.xml', handle_xml)
+        runner = web.AppRunner(app)
+        await runner.setup()
+        site = web.TCPSite(runner, '127.0.0.1', 0)
+        await site.start()
+        port = runner.addresses[0][1]
+        try:
+            async with AsyncFileMakerServer(f'http://127.0.0.1:{port}', 'username', 'password',
+                                            db='FMPHP_Sample', connection_limit=4) as fms:
+                return await coroutine_function(fms, queries)
+        finally:
+            await runner.cleanup()
+
+    return asyncio.run(main())
+
+
+def test_01_execute_async():
+    logging.basicConfig(level=logging.DEBUG)
+
+    async def check(fms, queries):
+        command = fms.create_find_records_command('Form View')
+        command_result = await command.execute_async()
+        assert len(command_result.records) == 12
+        assert all(isinstance(record, Record) for record in command_result.records)
+        assert command_result.layout.get_valuelist('Status')
+        # The data and the layout information were both fetched asynchronously.
+        assert {xml_grammar for xml_grammar, _ in queries} == {'fmresultset', 'FMPXMLLAYOUT'}
+
+        record = await fms.find_record_by_id_async('Form View', 7)
+        assert record.record_id == 7
+
+        layout_names = await fms.get_layout_names_async()
+        assert 'Form View' in layout_names
+
+    _run_with_server(check)
@@ -76,6 +76,30 @@ def test_coverage():
         del fmpxmllayout
 
 
+def test_data_grammar_iterparse():
+    # Feed the xml in small chunks and check that the streamed records
+    # are the same as those from the non-streaming parser.
+    root = Path(__file__).parent / 'data'
+    for path in root.glob('fmresultset*.xml'):
+        xml_bytes = path.open('rb').read()
+        fmresultset = DataGrammarParser().parse(xml_bytes)
+
+        chunks = (xml_bytes[i:i + 100] for i in range(0, len(xml_bytes), 100))
+        raw_items = DataGrammarParser().iterparse(chunks)
+        streamed_fmresultset = next(raw_items)
+        streamed_records = list(raw_items)
+
+        assert streamed_fmresultset.datasource == fmresultset.datasource
+        assert streamed_fmresultset.error == fmresultset.error
+        assert not streamed_fmresultset.resultset.records
+        assert len(streamed_records) == len(fmresultset.resultset.records)
+        for streamed_record, record in zip(streamed_records, fmresultset.resultset.records):
+            assert streamed_record.record_id == record.record_id
+            assert streamed_record.modification_id == record.modification_id
+            assert [(field.name, field.data) for field in streamed_record.fields] == \
+                   [(field.name, field.data) for field in record.fields]
+
+
 def _get_info_grammar_from_file(xml_path):
     xml_path = os.fspath(xml_path)
     if os.name == 'nt':
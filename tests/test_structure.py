@@ -0,0 +1,252 @@
+#!/usr/bin/env python3
+# coding: utf-8
+#
+# test_structure
+#
+"""
+Tests the creation of the structure objects (results, records etc.) from
+the responses in tests/data. Nothing goes out to the over the network or
+internet.
+"""
+import logging
+import re
+from array import array
+from pathlib import Path
+from urllib.parse import parse_qsl
+
+import pytest
+
+from fmxml import FileMakerServer, LayoutCache
+from fmxml.structure import (CommandResult, LazyCommandResult, ColumnarResult,
+                             Record, RecordSequence)
+
+__author__ = "recombinant"
+__copyright__ = "recombinant"
+__license__ = "BSD"
+
+
+class DataFileMakerServer(FileMakerServer):
+    """
+    Serves the responses from tests/data rather than the server.
+    """
+    queries = []
+
+    def execute_query(self, query, xml_grammar='fmresultset'):
+        self.queries.append((xml_grammar, query))
+        xml_path = Path(__file__).parent / 'data' / f'{xml_grammar}{query}.xml'
+        return xml_path.open('rb').read()
+
+
+class PagingFileMakerServer(DataFileMakerServer):
+    """
+    Serves the -skip and -max windows of -findall from the full -findall
+    response in tests/data.
+    """
+
+    def execute_query(self, query, xml_grammar='fmresultset'):
+        params = dict(parse_qsl(query))
+        skip = int(params.pop('-skip', 0))
+        max_ = params.pop('-max', None)
+        if query.endswith('-view'):
+            return super().execute_query(query, xml_grammar)
+        xml_bytes = super().execute_query('-db=FMPHP_Sample&-lay=Form View&-findall', xml_grammar)
+        self.queries[-1] = (xml_grammar, query)
+
+        xml = xml_bytes.decode('utf-8')
+        records = re.findall(r'<record .*?</record>', xml, re.S)
+        records = records[skip:] if max_ is None else records[skip:skip + int(max_)]
+        head = xml[:xml.index('<record ')]
+        head = re.sub(r'fetch-size="\d+"', f'fetch-size="{len(records)}"', head)
+        tail = xml[xml.rindex('</record>') + len('</record>'):]
+        return ''.join([head] + records + [tail]).encode('utf-8')
+
+
+@pytest.fixture(name='fms')
+def fixture_fms():
+    logging.basicConfig(level=logging.DEBUG)
+    fms_ = DataFileMakerServer(hostspec='http://localhost', username='username', password='password')
+    fms_.db_name = 'FMPHP_Sample'
+    fms_.queries = []
+    return fms_
+
+
+@pytest.fixture(name='layout_name')
+def fixture_layout_name():
+    return 'Form View'
+
+
+def test_01_command_result(fms, layout_name):
+    command_result = fms.create_find_records_command(layout_name).execute()
+
+    assert isinstance(command_result, CommandResult)
+    assert isinstance(command_result.records, list)
+    assert len(command_result.records) == 12
+    assert command_result.found_count == 12
+    assert command_result.layout.name == layout_name
+    assert command_result.records[0].get_field_value('Title') == 'Alaska 24/7'
+    assert command_result.records[0].get_field_values('Author') == \
+           ['Rick Smolan', 'David Elliot Cohen']
+
+
+def test_02_lazy_command_result(fms, layout_name):
+    command = fms.create_find_records_command(layout_name)
+    command_result = command.execute(lazy=True)
+
+    assert isinstance(command_result, LazyCommandResult)
+    assert command_result.total_count == 12
+    assert command_result.found_count == 12
+    assert command_result.fetch_size == 12
+    # Only the find has been executed, the layout has not been loaded.
+    assert len(fms.queries) == 1
+
+    records = command_result.records
+    assert isinstance(records, RecordSequence)
+    assert len(records) == 12
+    assert all(record is None for record in records._records)
+
+    record = records[3]
+    assert isinstance(record, Record)
+    assert record is records[3]
+    assert records._records.count(None) == 11
+
+    eager_records = command.execute().records
+    assert [record.record_id for record in records] == \
+           [record.record_id for record in eager_records]
+    assert [record.get_field_value('Title') for record in records[::-1]] == \
+           [record.get_field_value('Title') for record in eager_records[::-1]]
+
+
+def test_03_execute_stream(fms, layout_name):
+    class StreamingFileMakerServer(DataFileMakerServer):
+        def execute_query_stream(self, query, xml_grammar='fmresultset', chunk_size=65536):
+            xml_bytes = self.execute_query(query, xml_grammar)
+            for idx in range(0, len(xml_bytes), chunk_size):
+                yield xml_bytes[idx:idx + chunk_size]
+
+    fms_ = StreamingFileMakerServer(fms.hostspec, fms.username, fms.password, fms.db_name)
+    command = fms_.create_find_records_command(layout_name)
+    streamed_records = list(command.execute_stream(chunk_size=256))
+
+    records = command.execute().records
+    assert [record.record_id for record in streamed_records] == \
+           [record.record_id for record in records]
+    assert [record.get_field_values('Author') for record in streamed_records] == \
+           [record.get_field_values('Author') for record in records]
+
+
+def test_04_columnar_result(fms, layout_name):
+    command = fms.create_find_records_command(layout_name)
+    columnar_result = command.execute(columnar=True)
+    records = command.execute().records
+
+    assert isinstance(columnar_result, ColumnarResult)
+    assert len(columnar_result) == 12
+    assert columnar_result.found_count == 12
+    assert list(columnar_result.record_ids) == [record.record_id for record in records]
+    assert columnar_result.field_names == columnar_result.layout.field_names
+
+    for field_name in ['Title', 'Quantity in Stock', 'Number of Pages', 'Cover Image']:
+        assert list(columnar_result.get_column(field_name)) == \
+               [record.get_field_value(field_name) for record in records]
+
+    # Quantity in Stock is all whole numbers.
+    assert isinstance(columnar_result.get_column('Quantity in Stock'), array)
+
+    # Repetitions that are not present are None.
+    authors = columnar_result.get_columns('Author')
+    assert authors[0][0] == 'Rick Smolan'
+    assert authors[1][0] == 'David Elliot Cohen'
+    assert all(len(column) == 12 for column in authors)
+
+
+def test_05_columnar_result_numpy(fms, layout_name):
+    numpy = pytest.importorskip('numpy')
+    columnar_result = fms.create_find_records_command(layout_name).execute(columnar=True)
+
+    quantities = columnar_result.to_numpy('Quantity in Stock')
+    assert quantities.dtype == numpy.int64
+    assert quantities.tolist() == list(columnar_result.get_column('Quantity in Stock'))
+    assert columnar_result.to_numpy('Title').dtype == object
+
+
+@pytest.mark.parametrize('prefetch', [False, True])
+def test_06_iter_records(fms, layout_name, prefetch):
+    fms_ = PagingFileMakerServer(fms.hostspec, fms.username, fms.password, fms.db_name)
+    fms_.queries = []
+    command = fms_.create_find_records_command(layout_name)
+    expected = [record.record_id for record in command.execute().records]
+    fms_.queries.clear()
+
+    record_ids = [record.record_id for record in command.iter_records(page_size=5, prefetch=prefetch)]
+    assert record_ids == expected
+    # Three pages: 5 + 5 + 2
+    assert [query for _, query in fms_.queries if not query.endswith('-view')] == [
+        '-db=FMPHP_Sample&-lay=Form View&-max=5&-findall',
+        '-db=FMPHP_Sample&-lay=Form View&-skip=5&-max=5&-findall',
+        '-db=FMPHP_Sample&-lay=Form View&-skip=10&-max=5&-findall',
+    ]
+    # The command is unchanged.
+    assert command.skip == 0
+    assert command.max is None
+
+    # Skip and max are honoured.
+    command.set_skip(2)
+    command.set_max(7)
+    record_ids = [record.record_id for record in command.iter_records(page_size=3, prefetch=prefetch)]
+    assert record_ids == expected[2:9]
+
+
+def test_07_execute_parallel(fms, layout_name):
+    fms_ = PagingFileMakerServer(fms.hostspec, fms.username, fms.password, fms.db_name)
+    fms_.queries = []
+    command = fms_.create_find_records_command(layout_name)
+    expected = [record.record_id for record in command.execute().records]
+
+    records = command.execute_parallel(page_size=3, max_workers=3)
+    assert [record.record_id for record in records] == expected
+
+    command.set_skip(1)
+    command.set_max(8)
+    records = command.execute_parallel(page_size=3, max_workers=2)
+    assert [record.record_id for record in records] == expected[1:9]
+    assert command.skip == 1
+    assert command.max == 8
+
+
+def test_08_layout_cache(fms, layout_name, tmp_path):
+    layout_cache = LayoutCache(tmp_path, ttl=60)
+    fms_ = DataFileMakerServer(fms.hostspec, fms.username, fms.password, fms.db_name,
+                               layout_cache=layout_cache)
+    fms_.queries = []
+    layout = fms_.get_layout(layout_name)
+    assert len(fms_.queries) == 2
+    assert layout_cache.get(fms_.hostspec, fms_.db_name, layout_name) is not None
+
+    # Another process (or a fresh instance) does not go to the server.
+    fms_ = DataFileMakerServer(fms.hostspec, fms.username, fms.password, fms.db_name,
+                               layout_cache=LayoutCache(tmp_path, ttl=60))
+    fms_.queries = []
+    cached_layout = fms_.get_layout(layout_name)
+    assert fms_.queries == []
+    assert cached_layout.field_names == layout.field_names
+    assert cached_layout.portal_names == layout.portal_names
+    assert list(cached_layout.get_valuelist('Status')) == list(layout.get_valuelist('Status'))
+    assert cached_layout.get_field_definition('Status').get_valuelist() is not None
+
+    # Entries for other hosts are separate.
+    assert layout_cache.get('http://elsewhere', fms_.db_name, layout_name) is None
+
+    # Manual invalidation.
+    fms_.invalidate_layout(layout_name)
+    assert layout_cache.get(fms_.hostspec, fms_.db_name, layout_name) is None
+    fms_.get_layout(layout_name)
+    assert len(fms_.queries) == 2
+
+    # Expired and corrupt entries are ignored.
+    assert LayoutCache(tmp_path, ttl=1e-9).get(fms_.hostspec, fms_.db_name, layout_name) is None
+    for path in tmp_path.glob('*.layout'):
+        path.write_bytes(b'not a pickle')
+    assert layout_cache.get(fms_.hostspec, fms_.db_name, layout_name) is None
+
+    layout_cache.clear()
+    assert list(tmp_path.iterdir()) == []